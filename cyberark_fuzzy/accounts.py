@@ -1,17 +1,27 @@
 """Account operations."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
-
-from rich.console import Console
-from rich.table import Table
+from typing import Any, Callable, Optional
 
 from .api import CyberArkAPI, APIError
+from .console import get_console
+
+# display_accounts columns: (header, style)
+_TABLE_COLUMNS = (
+    ("ID", "dim"),
+    ("Address", "cyan"),
+    ("Username", "green"),
+    ("Platform", "yellow"),
+    ("Safe", "blue"),
+    ("Status", "magenta"),
+)
 
-console = Console()
+MAX_WORKERS = 8  # Concurrent requests for bulk operations (capped by max_connections)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Account:
     """Represents a CyberArk account."""
     
@@ -49,10 +59,9 @@ class AccountManager:
     def search(self, query: str) -> list[Account]:
         """Search for accounts matching query."""
         try:
-            results = self.api.search_accounts(query)
-            return [Account.from_api(acc) for acc in results]
+            return [Account.from_api(acc) for acc in self.api.iter_search_accounts(query)]
         except APIError as e:
-            console.print(f"[red]Search failed: {e.message}[/red]")
+            get_console().print(f"[red]Search failed: {e.message}[/red]")
             return []
     
     def get_password(self, account: Account) -> Optional[str]:
@@ -61,7 +70,7 @@ class AccountManager:
             result = self.api.get_account_password(account.id)
             return result
         except APIError as e:
-            console.print(f"[red]Failed to get password: {e.message}[/red]")
+            get_console().print(f"[red]Failed to get password: {e.message}[/red]")
             return None
     
     def get_info(self, account: Account) -> Optional[dict]:
@@ -69,55 +78,145 @@ class AccountManager:
         try:
             return self.api.get_account(account.id)
         except APIError as e:
-            console.print(f"[red]Failed to get account info: {e.message}[/red]")
+            get_console().print(f"[red]Failed to get account info: {e.message}[/red]")
             return None
     
     def verify(self, account: Account) -> bool:
         """Trigger password verification."""
         try:
             self.api.verify_account(account.id)
-            console.print(f"[green]Verification triggered for {account.username}@{account.address}[/green]")
+            get_console().print(f"[green]Verification triggered for {account.username}@{account.address}[/green]")
             return True
         except APIError as e:
-            console.print(f"[red]Verification failed: {e.message}[/red]")
+            get_console().print(f"[red]Verification failed: {e.message}[/red]")
             return False
     
     def change(self, account: Account) -> bool:
         """Trigger password change."""
         try:
             self.api.change_account(account.id)
-            console.print(f"[green]Change triggered for {account.username}@{account.address}[/green]")
+            get_console().print(f"[green]Change triggered for {account.username}@{account.address}[/green]")
             return True
         except APIError as e:
-            console.print(f"[red]Change failed: {e.message}[/red]")
+            get_console().print(f"[red]Change failed: {e.message}[/red]")
             return False
     
     def delete(self, account: Account, confirm: bool = True) -> bool:
         """Delete an account."""
         if confirm:
-            console.print(f"[bold red]About to delete: {account.username}@{account.address}[/bold red]")
+            get_console().print(f"[bold red]About to delete: {account.username}@{account.address}[/bold red]")
             response = input("Are you sure? (yes/no): ")
             if response.lower() != "yes":
-                console.print("[yellow]Cancelled[/yellow]")
+                get_console().print("[yellow]Cancelled[/yellow]")
                 return False
         
         try:
             self.api.delete_account(account.id)
-            console.print(f"[green]Deleted {account.username}@{account.address}[/green]")
+            get_console().print(f"[green]Deleted {account.username}@{account.address}[/green]")
             return True
         except APIError as e:
-            console.print(f"[red]Delete failed: {e.message}[/red]")
+            get_console().print(f"[red]Delete failed: {e.message}[/red]")
             return False
     
-    def display_accounts(self, accounts: list[Account]) -> None:
-        """Display accounts in a table."""
-        table = Table(title="Accounts")
+    # -------------------------------------------------------------------------
+    # Bulk operations
+    # -------------------------------------------------------------------------
+    # Each account is a separate HTTP round trip, so bulk calls run on a
+    # thread pool over the shared requests.Session (safe for concurrent
+    # requests; the mounted adapter pools connections). Results come back
+    # in input order as (account, result) pairs, where result is the
+    # APIError raised for that account on failure.
+    
+    def _run_many(
+        self,
+        func: Callable[[str], Any],
+        accounts: list[Account],
+    ) -> list[tuple[Account, Any]]:
+        """Run an API call for each account concurrently."""
+        def run_one(account: Account) -> tuple[Account, Any]:
+            try:
+                return account, func(account.id)
+            except APIError as e:
+                return account, e
+        
+        workers = min(MAX_WORKERS, self.api.config.max_connections)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_one, accounts))
+    
+    def _report_many(self, results: list[tuple[Account, Any]], action: str) -> None:
+        """Print one line per account for a bulk operation."""
+        for account, result in results:
+            if isinstance(result, APIError):
+                get_console().print(f"[red]{action} failed for {account.username}@{account.address}: {result.message}[/red]")
+            else:
+                get_console().print(f"[green]{action} triggered for {account.username}@{account.address}[/green]")
+    
+    def verify_many(self, accounts: list[Account]) -> list[tuple[Account, Any]]:
+        """Trigger password verification for several accounts."""
+        results = self._run_many(self.api.verify_account, accounts)
+        self._report_many(results, "Verification")
+        return results
+    
+    def change_many(self, accounts: list[Account]) -> list[tuple[Account, Any]]:
+        """Trigger password change for several accounts."""
+        results = self._run_many(self.api.change_account, accounts)
+        self._report_many(results, "Change")
+        return results
+    
+    def get_info_many(self, accounts: list[Account]) -> list[tuple[Account, Any]]:
+        """Get detailed account information for several accounts."""
+        return self._run_many(self.api.get_account, accounts)
+    
+    def delete_many(self, accounts: list[Account], confirm_all: bool = False) -> list[tuple[Account, Any]]:
+        """
+        Delete several accounts.
+        
+        With confirm_all, asks once for the whole list instead of per account.
+        Outcomes are shown in a single table once all deletes have finished.
+        """
+        if confirm_all:
+            get_console().print(f"[bold red]About to delete {len(accounts)} accounts:[/bold red]")
+            for account in accounts:
+                get_console().print(f"  {account.username}@{account.address}")
+            response = input("Are you sure? (yes/no): ")
+            if response.lower() != "yes":
+                get_console().print("[yellow]Cancelled[/yellow]")
+                return []
+        
+        results = self._run_many(self.api.delete_account, accounts)
+        
+        from rich.table import Table
+        
+        table = Table(title="Delete results")
         table.add_column("ID", style="dim")
-        table.add_column("Address", style="cyan")
-        table.add_column("Username", style="green")
-        table.add_column("Platform", style="yellow")
-        table.add_column("Safe", style="blue")
-        table.add_column("Status", style="magenta")
+        table.add_column("Account", style="cyan")
+        table.add_column("Result")
+        for account, result in results:
+            if isinstance(result, APIError):
+                outcome = f"[red]Failed: {result.message}[/red]"
+            else:
+                outcome = "[green]Deleted[/green]"
+            table.add_row(account.id, f"{account.username}@{account.address}", outcome)
+        get_console().print(table)
+        
+        return results
+    
+    def display_accounts(self, accounts: list[Account]) -> None:
+        """Display accounts in a table (tab-separated lines when not on a terminal)."""
+        if not self.api.config.rich_output or not sys.stdout.isatty():
+            sys.stdout.write("".join(
+                # JSON nulls come through from_api as None; print them as empty fields
+                "\t".join(f or "" for f in (acc.id, acc.address, acc.username, acc.platform_id, acc.safe_name, acc.status)) + "\n"
+                for acc in accounts
+            ))
+            return
+        
+        from rich.table import Table
+        
+        table = Table(title="Accounts", expand=False)
+        for name, style in _TABLE_COLUMNS:
+            # no_wrap keeps each row on one line, so Rich never re-flows cells
+            table.add_column(name, style=style, no_wrap=True)
         
         for acc in accounts:
             table.add_row(
@@ -129,5 +228,5 @@ class AccountManager:
                 acc.status,
             )
         
-        console.print(table)
+        get_console().print(table)
 
@@ -1,11 +1,47 @@
 """CyberArk REST API client."""
 
+import os
+import time
 import requests
-from typing import Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Any, Iterator
 from dataclasses import dataclass
 
+try:
+    import ijson  # Optional: stream-parse large search results
+except ImportError:
+    ijson = None
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads  # Optional: faster JSON
+except ImportError:
+    import json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
 from .config import Config
 
+MAX_ERROR_TEXT = 512  # Never echo a whole HTML error page back to the user
+
+# get_account results are reused briefly (info -> verify -> info flows)
+ACCOUNT_CACHE_TTL = 30.0  # seconds
+ACCOUNT_CACHE_SIZE = 512
+
+_insecure_warnings_disabled = False
+
+
+def _disable_insecure_warnings() -> None:
+    """Silence urllib3's unverified-HTTPS warning (once per process)."""
+    global _insecure_warnings_disabled
+    if not _insecure_warnings_disabled:
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        _insecure_warnings_disabled = True
+
 
 @dataclass
 class APIError(Exception):
@@ -22,46 +58,93 @@ class CyberArkAPI:
         self.config = config
         self.session = requests.Session()
         self.session.verify = config.verify_ssl
+        self.session.headers["Content-Type"] = "application/json"
+        
+        # All traffic goes to a single CyberArk host; keep enough pooled
+        # connections around that bursts of calls reuse warm sockets.
+        # Throttled (429) and transient 5xx responses back off exponentially,
+        # honouring Retry-After when the server sends one. Only GET and
+        # DELETE are repeated on a bad status; POSTs are sent once.
+        # raise_on_status=False hands the final response back to _request
+        # so exhausted retries still surface as APIError.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=config.max_connections,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504),
+                respect_retry_after_header=True,
+                allowed_methods=frozenset(["GET", "DELETE"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._token: Optional[str] = None
+        # Monotonic time the server last accepted our token (None = unknown)
+        self._last_ok: Optional[float] = None
+        # account_id -> (monotonic time fetched, account details)
+        self._account_cache: dict[str, tuple[float, dict]] = {}
+        
+        # Hoisted out of the per-request path
+        self._base_url = f"{config.base_url}/PasswordVault/API"
+        self._accounts_url = f"{self._base_url}/Accounts"
+        self._logon_url = f"{self._base_url}/Auth/RADIUS/Logon"
+        self._ssh_url = f"{self._base_url}/Users/Secret/SSHKeys/Cache/"
         
         # Suppress SSL warnings if not verifying
         if not config.verify_ssl:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_insecure_warnings()
     
     @property
     def base_url(self) -> str:
-        return f"{self.config.base_url}/PasswordVault/API"
+        return self._base_url
     
     @property
     def token(self) -> Optional[str]:
         """Get current session token."""
-        if self._token:
-            return self._token
-        # Try loading from file
-        if self.config.token_path.exists():
-            self._token = self.config.token_path.read_text().strip()
+        if self._token is None:
+            self._load_token()
         return self._token
     
     @token.setter
     def token(self, value: str) -> None:
         """Set and persist session token."""
-        self._token = value
+        if value == self._token:
+            return
+        self._use_token(value)
         self.config.ensure_config_dir()
-        self.config.token_path.write_text(value)
+        # Write-then-rename so the keepalive process never reads a partial token
+        tmp_path = self.config.token_path.with_name("token.tmp")
+        tmp_path.write_text(value)
+        os.replace(tmp_path, self.config.token_path)
     
     def clear_token(self) -> None:
         """Clear session token."""
-        self._token = None
-        if self.config.token_path.exists():
-            self.config.token_path.unlink()
+        self._use_token("")
+        self._last_ok = None
+        self._account_cache.clear()
+        self.config.token_path.unlink(missing_ok=True)
     
-    def _headers(self) -> dict:
-        """Get request headers."""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = self.token
-        return headers
+    def _load_token(self) -> None:
+        """Load the stored token once; later calls use the cached value."""
+        try:
+            # Tokens are plain ASCII; skip the text-mode UTF-8 decoder
+            with open(self.config.token_path, "rb") as f:
+                token = f.read().decode("ascii", "replace").strip()
+        except FileNotFoundError:
+            token = ""
+        self._use_token(token)
+    
+    def _use_token(self, value: str) -> None:
+        """Cache the token and attach it to the session headers."""
+        self._token = value
+        if value:
+            self.session.headers["Authorization"] = value
+        else:
+            self.session.headers.pop("Authorization", None)
     
     def _request(
         self,
@@ -71,30 +154,67 @@ class CyberArkAPI:
         params: Optional[dict] = None,
     ) -> Any:
         """Make an API request."""
-        url = f"{self.base_url}/{endpoint}"
+        return self._send(method, f"{self._base_url}/{endpoint}", data, params)
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Any:
+        """Send a request to a full URL and decode the JSON response."""
+        if self._token is None:
+            self._load_token()
         
         response = self.session.request(
             method=method,
             url=url,
-            headers=self._headers(),
-            json=data,
+            data=_json_dumps(data) if data is not None else None,
             params=params,
         )
         
+        self._raise_for_status(response)
+        # Verify/Change/Delete answer with an empty body; don't decode it
+        if not response.content:
+            return None
+        return _json_loads(response.content)
+    
+    def _raise_for_status(self, response: requests.Response) -> None:
+        """Raise APIError for a failed response, tracking session validity."""
         if response.status_code >= 400:
-            error_msg = response.text
+            if response.status_code == 401:
+                self._last_ok = None
+            error_msg = None
             error_code = None
-            try:
-                error_data = response.json()
-                error_msg = error_data.get("ErrorMessage", error_msg)
-                error_code = error_data.get("ErrorCode")
-            except:
-                pass
+            # Only JSON bodies carry ErrorMessage/ErrorCode; skip parsing
+            # empty bodies and HTML error pages entirely
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                try:
+                    error_data = _json_loads(response.content)
+                    error_msg = error_data.get("ErrorMessage")
+                    error_code = error_data.get("ErrorCode")
+                except (ValueError, AttributeError):
+                    pass
+            if error_msg is None:
+                error_msg = response.text[:MAX_ERROR_TEXT]
             raise APIError(response.status_code, error_msg, error_code)
         
-        if response.text:
-            return response.json()
-        return None
+        self._last_ok = time.monotonic()
+    
+    def _raw_post(self, url: str, data: dict, include_auth: bool) -> requests.Response:
+        """POST to an auth endpoint and return the raw response."""
+        if include_auth:
+            if self._token is None:
+                self._load_token()
+            headers = None
+        else:
+            headers = {"Authorization": None}  # None drops the session header
+        
+        response = self.session.post(url, data=_json_dumps(data), headers=headers)
+        if response.status_code >= 400:
+            raise APIError(response.status_code, response.text[:MAX_ERROR_TEXT])
+        return response
     
     def get(self, endpoint: str, params: Optional[dict] = None) -> Any:
         """GET request."""
@@ -124,16 +244,13 @@ class CyberArkAPI:
             "concurrentSession": concurrent,
         }
         
-        # RADIUS auth endpoint
-        url = f"{self.config.base_url}/PasswordVault/API/Auth/RADIUS/Logon"
-        response = self.session.post(url, json=data, headers={"Content-Type": "application/json"})
-        
-        if response.status_code >= 400:
-            raise APIError(response.status_code, response.text)
+        # Logon must not carry a stale session token
+        response = self._raw_post(self._logon_url, data, include_auth=False)
         
         # Token is returned as a quoted string
         token = response.text.strip().strip('"')
         self.token = token
+        self._last_ok = time.monotonic()
         return token
     
     def logoff(self) -> None:
@@ -145,10 +262,17 @@ class CyberArkAPI:
                 pass
             self.clear_token()
     
-    def verify_session(self) -> bool:
-        """Check if the current session is valid."""
+    def verify_session(self, max_age: float = 0.0) -> bool:
+        """
+        Check if the current session is valid.
+        
+        If any request succeeded within the last max_age seconds the
+        session is trusted without another round trip.
+        """
         if not self.token:
             return False
+        if max_age and self._last_ok is not None and time.monotonic() - self._last_ok < max_age:
+            return True
         try:
             self.get("Safes", params={"limit": 1})
             return True
@@ -177,26 +301,57 @@ class CyberArkAPI:
         result = self.get("Accounts", params=params)
         return result.get("value", [])
     
+    def iter_search_accounts(self, search: str, limit: int = 100) -> Iterator[dict]:
+        """
+        Search for accounts, yielding results as they are parsed.
+        
+        With ijson installed the response is streamed, so the full result
+        set is never held in memory; otherwise falls back to search_accounts.
+        """
+        if ijson is None:
+            yield from self.search_accounts(search, limit)
+            return
+        
+        if self._token is None:
+            self._load_token()
+        params = {"search": search, "limit": limit}
+        with self.session.get(self._accounts_url, params=params, stream=True) as response:
+            self._raise_for_status(response)
+            response.raw.decode_content = True  # Let urllib3 undo gzip
+            yield from ijson.items(response.raw, "value.item")
+    
     def get_account(self, account_id: str) -> dict:
-        """Get account details."""
-        return self.get(f"Accounts/{account_id}")
+        """Get account details (cached for ACCOUNT_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        cached = self._account_cache.get(account_id)
+        if cached and now - cached[0] < ACCOUNT_CACHE_TTL:
+            return cached[1]
+        
+        result = self.get(f"Accounts/{account_id}")
+        if len(self._account_cache) >= ACCOUNT_CACHE_SIZE:
+            self._account_cache.clear()
+        self._account_cache[account_id] = (now, result)
+        return result
     
     def get_account_password(self, account_id: str) -> str:
-        """Retrieve account password."""
+        """Retrieve account password (never cached: each retrieval is audited)."""
         result = self.post(f"Accounts/{account_id}/Password/Retrieve")
         return result
     
     def verify_account(self, account_id: str) -> None:
         """Trigger password verification."""
-        self.post(f"Accounts/{account_id}/Verify")
+        self._account_cache.pop(account_id, None)
+        self._send("POST", f"{self._accounts_url}/{account_id}/Verify")
     
     def change_account(self, account_id: str) -> None:
         """Trigger password change."""
-        self.post(f"Accounts/{account_id}/Change")
+        self._account_cache.pop(account_id, None)
+        self._send("POST", f"{self._accounts_url}/{account_id}/Change")
     
     def delete_account(self, account_id: str) -> None:
         """Delete an account."""
-        self.delete(f"Accounts/{account_id}")
+        self._account_cache.pop(account_id, None)
+        self._send("DELETE", f"{self._accounts_url}/{account_id}")
     
     # ---------------------------------------------------------------------
     # SSH Keys (MFA Caching)
@@ -208,19 +363,10 @@ class CyberArkAPI:
         
         Returns the private key in OpenSSH format.
         """
-        url = f"{self.config.base_url}/PasswordVault/API/Users/Secret/SSHKeys/Cache/"
         data = {"keyPassword": "", "formats": ["OpenSSH"]}
+        response = self._raw_post(self._ssh_url, data, include_auth=True)
         
-        response = self.session.post(
-            url,
-            json=data,
-            headers=self._headers(),
-        )
-        
-        if response.status_code >= 400:
-            raise APIError(response.status_code, response.text)
-        
-        result = response.json()
+        result = _json_loads(response.content)
         for key_format in result.get("value", []):
             if key_format.get("format") == "OpenSSH":
                 return key_format.get("privateKey")
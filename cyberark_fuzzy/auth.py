@@ -9,12 +9,16 @@ from pathlib import Path
 from typing import Optional
 from getpass import getpass
 
-from rich.console import Console
-
 from .config import Config
 from .api import CyberArkAPI, APIError
+from .console import get_console
+
+if os.name == "nt":
+    import ctypes
 
-console = Console()
+# Skip the session probe if the API confirmed the token this recently.
+# Well inside CyberArk's 20 minute inactivity timeout.
+SESSION_CHECK_TTL = 30.0  # seconds
 
 
 class AuthManager:
@@ -43,9 +47,9 @@ class AuthManager:
         try:
             import keyring
             keyring.set_password("cyberark-fuzzy", self.config.username, password)
-            console.print("[green]Password saved to credential store[/green]")
+            get_console().print("[green]Password saved to credential store[/green]")
         except Exception as e:
-            console.print(f"[yellow]Could not save password: {e}[/yellow]")
+            get_console().print(f"[yellow]Could not save password: {e}[/yellow]")
     
     def authenticate(self, save_password: bool = False) -> bool:
         """
@@ -56,29 +60,33 @@ class AuthManager:
         password = self.get_password()
         
         try:
-            console.print(f"[cyan]Authenticating as {self.config.username}...[/cyan]")
+            get_console().print(f"[cyan]Authenticating as {self.config.username}...[/cyan]")
             self.api.logon_radius(self.config.username, password)
-            console.print("[green]Authentication successful[/green]")
+            get_console().print("[green]Authentication successful[/green]")
             
             if save_password:
                 self.save_password(password)
             
             return True
         except APIError as e:
-            console.print(f"[red]Authentication failed: {e.message}[/red]")
+            get_console().print(f"[red]Authentication failed: {e.message}[/red]")
             return False
     
-    def check_and_refresh(self) -> bool:
+    def check_and_refresh(self, save_password: bool = False) -> bool:
         """
         Check if session is valid, re-authenticate if needed.
         
+        The check is skipped if the API confirmed the token within
+        SESSION_CHECK_TTL seconds, so calling this before every action costs
+        no round trip in an active session.
+        
         Returns True if we have a valid session.
         """
-        if self.api.verify_session():
+        if self.api.verify_session(max_age=SESSION_CHECK_TTL):
             return True
         
-        console.print("[yellow]Session expired, re-authenticating...[/yellow]")
-        return self.authenticate()
+        get_console().print("[yellow]Session expired, re-authenticating...[/yellow]")
+        return self.authenticate(save_password=save_password)
     
     # -------------------------------------------------------------------------
     # Token keepalive (detached subprocess)
@@ -108,11 +116,18 @@ class AuthManager:
             return False
         
         try:
-            pid = int(pid_path.read_text().strip())
+            pid_text = pid_path.read_text().strip()
+        except OSError:
+            return False
+        if not pid_text:
+            # Being written by a starting keepalive; not stale yet
+            return False
+        
+        try:
+            pid = int(pid_text)
             # Check if process exists
             if os.name == "nt":
                 # Windows
-                import ctypes
                 kernel32 = ctypes.windll.kernel32
                 handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
                 if handle:
@@ -139,7 +154,7 @@ class AuthManager:
             timeout_hours: Hard timeout in hours (default: from config, typically 9)
         """
         if self._is_keepalive_running():
-            console.print("[cyan]Keepalive already running[/cyan]")
+            get_console().print("[cyan]Keepalive already running[/cyan]")
             return
         
         # Use config value if not specified
@@ -186,21 +201,25 @@ class AuthManager:
                 stdin=subprocess.DEVNULL,
             )
         
-        # Give it a moment to write its PID
-        time.sleep(0.5)
+        # Give it up to 500ms to write its PID, checking every 10ms
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            if self.config.keepalive_pid_path.exists() and self._is_keepalive_running():
+                break
+            time.sleep(0.01)
         
         if self._is_keepalive_running():
             pid = self.config.keepalive_pid_path.read_text().strip()
-            console.print(f"[green]Token keepalive started (PID: {pid}, timeout: {timeout_hours}h)[/green]")
+            get_console().print(f"[green]Token keepalive started (PID: {pid}, timeout: {timeout_hours}h)[/green]")
         else:
-            console.print("[yellow]Keepalive may have failed to start - check keepalive.log[/yellow]")
+            get_console().print("[yellow]Keepalive may have failed to start - check keepalive.log[/yellow]")
     
     def stop_keepalive(self) -> None:
         """Stop the keepalive subprocess."""
         pid_path = self.config.keepalive_pid_path
         
         if not pid_path.exists():
-            console.print("[yellow]No keepalive process running[/yellow]")
+            get_console().print("[yellow]No keepalive process running[/yellow]")
             return
         
         try:
@@ -214,9 +233,9 @@ class AuthManager:
                 # Unix
                 os.kill(pid, signal.SIGTERM)
             
-            console.print(f"[yellow]Keepalive stopped (PID: {pid})[/yellow]")
+            get_console().print(f"[yellow]Keepalive stopped (PID: {pid})[/yellow]")
         except (ValueError, OSError, ProcessLookupError) as e:
-            console.print(f"[yellow]Could not stop keepalive: {e}[/yellow]")
+            get_console().print(f"[yellow]Could not stop keepalive: {e}[/yellow]")
         finally:
             pid_path.unlink(missing_ok=True)
     
@@ -251,7 +270,7 @@ class AuthManager:
             )
             
         except subprocess.CalledProcessError as e:
-            console.print(
+            get_console().print(
                 f"[yellow]Warning: Could not set key permissions automatically.[/yellow]\n"
                 f"[yellow]You may need to manually restrict access to: {key_path}[/yellow]"
             )
@@ -268,16 +287,16 @@ class AuthManager:
         if key_path.exists():
             key_age_hours = (time.time() - key_path.stat().st_mtime) / 3600
             if key_age_hours < self.config.key_max_age_hours:
-                console.print(f"[cyan]SSH key is {key_age_hours:.1f} hours old, still valid[/cyan]")
+                get_console().print(f"[cyan]SSH key is {key_age_hours:.1f} hours old, still valid[/cyan]")
                 return True
-            console.print(f"[yellow]SSH key is {key_age_hours:.1f} hours old, refreshing...[/yellow]")
+            get_console().print(f"[yellow]SSH key is {key_age_hours:.1f} hours old, refreshing...[/yellow]")
         else:
-            console.print("[cyan]No SSH key found, downloading...[/cyan]")
+            get_console().print("[cyan]No SSH key found, downloading...[/cyan]")
         
         try:
             private_key = self.api.get_ssh_key()
             if not private_key:
-                console.print("[red]Failed to retrieve SSH key[/red]")
+                get_console().print("[red]Failed to retrieve SSH key[/red]")
                 return False
             
             # Ensure .ssh directory exists
@@ -293,10 +312,10 @@ class AuthManager:
             else:
                 os.chmod(key_path, 0o600)
             
-            console.print(f"[green]SSH key saved to {key_path}[/green]")
+            get_console().print(f"[green]SSH key saved to {key_path}[/green]")
             return True
             
         except APIError as e:
-            console.print(f"[red]Failed to download SSH key: {e.message}[/red]")
+            get_console().print(f"[red]Failed to download SSH key: {e.message}[/red]")
             return False
 
@@ -7,6 +7,14 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
+# Project root (where main.py lives). resolve() gives an absolute path on
+# Windows and Linux regardless of CWD; it only needs to run once.
+_CONFIG_DIR = Path(__file__).resolve().parent.parent
+_TOKEN_PATH = _CONFIG_DIR / "token"
+_KEEPALIVE_PID_PATH = _CONFIG_DIR / "keepalive.pid"
+_KEEPALIVE_LOG_PATH = _CONFIG_DIR / "keepalive.log"
+
+
 @dataclass
 class Config:
     """Application configuration."""
@@ -15,6 +23,7 @@ class Config:
     endpoint: str = "cyberark"
     username: str = ""  # Set in config.ini or via --username
     verify_ssl: bool = False
+    max_connections: int = 32  # Pooled HTTP connections to the endpoint
     
     # SSH settings
     ssh_key_path: str = ""
@@ -41,24 +50,22 @@ class Config:
     @property
     def config_dir(self) -> Path:
         """Get the config directory path (project root, where main.py lives)."""
-        # Use resolve() to get absolute path - works on Windows and Linux
-        # regardless of current working directory
-        return Path(__file__).resolve().parent.parent
+        return _CONFIG_DIR
     
     @property
     def token_path(self) -> Path:
         """Path to stored session token."""
-        return self.config_dir / "token"
+        return _TOKEN_PATH
     
     @property
     def keepalive_pid_path(self) -> Path:
         """Path to keepalive PID file."""
-        return self.config_dir / "keepalive.pid"
+        return _KEEPALIVE_PID_PATH
     
     @property
     def keepalive_log_path(self) -> Path:
         """Path to keepalive log file."""
-        return self.config_dir / "keepalive.log"
+        return _KEEPALIVE_LOG_PATH
     
     def ensure_config_dir(self) -> None:
         """Create config directory if it doesn't exist."""
@@ -77,13 +84,10 @@ def _find_config_file() -> Optional[Path]:
     2. <project>/config.ini (where main.py lives)
     3. <project>/config.ini.example (fallback)
     """
-    # Project root is where main.py lives (parent of cyberark_fuzzy package)
-    project_root = Path(__file__).resolve().parent.parent
-    
     candidates = [
         Path("config.ini"),  # CWD - for convenience when running from project dir
-        project_root / "config.ini",
-        project_root / "config.ini.example",
+        _CONFIG_DIR / "config.ini",
+        _CONFIG_DIR / "config.ini.example",
     ]
     
     for path in candidates:
@@ -98,6 +102,38 @@ def _parse_bool(value: str) -> bool:
     return value.lower() in ("true", "yes", "1", "on")
 
 
+def _parse_connections(value: str) -> int:
+    """Parse a connection pool size; at least 1 so the worker pool is never empty."""
+    return max(1, int(value))
+
+
+def _parse_key_path(value: str) -> str:
+    """Parse an SSH key path, resolving relative paths against project root, not CWD."""
+    value = value.strip()
+    if not value:
+        return ""  # Falls back to the default key path in load_config
+    key_path = Path(value)
+    if not key_path.is_absolute():
+        key_path = _CONFIG_DIR / value
+    return str(key_path)
+
+
+# INI options: (section, option, Config attribute, parser)
+_SCHEMA = (
+    ("cyberark", "endpoint", "endpoint", str),
+    ("cyberark", "username", "username", str),
+    ("cyberark", "verify_ssl", "verify_ssl", _parse_bool),
+    ("cyberark", "max_connections", "max_connections", _parse_connections),
+    ("ssh", "ssh_key_path", "ssh_key_path", _parse_key_path),
+    ("ssh", "key_max_age_hours", "key_max_age_hours", int),
+    ("keepalive", "min_seconds", "keepalive_min_seconds", int),
+    ("keepalive", "max_seconds", "keepalive_max_seconds", int),
+    ("keepalive", "timeout_hours", "keepalive_timeout_hours", float),
+    ("ui", "rich_output", "rich_output", _parse_bool),
+    ("ui", "default_search", "default_search", str.strip),
+)
+
+
 def load_config(
     config_file: Optional[Path] = None,
     endpoint: Optional[str] = None,
@@ -124,43 +160,10 @@ def load_config(
         parser = configparser.ConfigParser()
         parser.read(config_file)
         
-        # [cyberark] section
-        if parser.has_section("cyberark"):
-            if parser.has_option("cyberark", "endpoint"):
-                config.endpoint = parser.get("cyberark", "endpoint")
-            if parser.has_option("cyberark", "username"):
-                config.username = parser.get("cyberark", "username")
-            if parser.has_option("cyberark", "verify_ssl"):
-                config.verify_ssl = _parse_bool(parser.get("cyberark", "verify_ssl"))
-        
-        # [ssh] section
-        if parser.has_section("ssh"):
-            if parser.has_option("ssh", "ssh_key_path"):
-                val = parser.get("ssh", "ssh_key_path").strip()
-                if val:
-                    # Resolve relative paths against project root, not CWD
-                    key_path = Path(val)
-                    if not key_path.is_absolute():
-                        key_path = config.config_dir / val
-                    config.ssh_key_path = str(key_path)
-            if parser.has_option("ssh", "key_max_age_hours"):
-                config.key_max_age_hours = parser.getint("ssh", "key_max_age_hours")
-        
-        # [keepalive] section
-        if parser.has_section("keepalive"):
-            if parser.has_option("keepalive", "min_seconds"):
-                config.keepalive_min_seconds = parser.getint("keepalive", "min_seconds")
-            if parser.has_option("keepalive", "max_seconds"):
-                config.keepalive_max_seconds = parser.getint("keepalive", "max_seconds")
-            if parser.has_option("keepalive", "timeout_hours"):
-                config.keepalive_timeout_hours = parser.getfloat("keepalive", "timeout_hours")
-        
-        # [ui] section
-        if parser.has_section("ui"):
-            if parser.has_option("ui", "rich_output"):
-                config.rich_output = _parse_bool(parser.get("ui", "rich_output"))
-            if parser.has_option("ui", "default_search"):
-                config.default_search = parser.get("ui", "default_search").strip()
+        # has_option() is False for a missing section too
+        for section, option, attr, parse in _SCHEMA:
+            if parser.has_option(section, option):
+                setattr(config, attr, parse(parser.get(section, option)))
     
     # CLI overrides take precedence
     if endpoint:
@@ -0,0 +1,10 @@
+"""Shared Rich console, created on first use."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_console():
+    """Get the shared Rich console (imports rich on first call)."""
+    from rich.console import Console
+    return Console()
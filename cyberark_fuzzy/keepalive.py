@@ -12,32 +12,64 @@ Usage:
 import os
 import sys
 import time
+import atexit
 import random
 import signal
 import argparse
+import functools
 from pathlib import Path
-from datetime import datetime
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_dir() -> Path:
-    """Get the project root directory."""
-    return Path(__file__).parent.parent
+    """Get the project root directory (resolved once)."""
+    return Path(__file__).resolve().parent.parent
 
 
-def log(message: str, log_path: Path) -> None:
-    """Append a timestamped message to the log file."""
-    with open(log_path, "a") as f:
-        f.write(f"[{datetime.now()}] {message}\n")
+def log(message: str, log_fd: int) -> None:
+    """Append a timestamped message to the log file descriptor."""
+    line = time.strftime("[%Y-%m-%d %H:%M:%S] ") + message + "\n"
+    os.write(log_fd, line.encode())
 
 
-def ping_api(endpoint: str, token: str, verify_ssl: bool = False) -> bool:
-    """Ping the CyberArk API to keep the token alive."""
+def _cleanup_and_exit(pid_path: Path, code: int) -> None:
+    """Remove our PID file and exit."""
+    pid_path.unlink(missing_ok=True)
+    sys.exit(code)
+
+
+def _shutdown(log_fd: int, pid_path: Path, signum, frame) -> None:
+    """Signal handler for graceful shutdown (bound with functools.partial)."""
+    log(f"Received signal {signum}, shutting down", log_fd)
+    _cleanup_and_exit(pid_path, 0)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_session(verify_ssl: bool):
+    """
+    Get the session shared by every ping.
+    
+    Keeping one pooled connection alive means pings after the first skip
+    the TCP+TLS handshake. Pings are far enough apart that the server may
+    have dropped that socket, so the GET is retried once on a fresh one.
+    requests is only imported on first use.
+    """
     import requests
     import urllib3
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     
     if not verify_ssl:
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     
+    session = requests.Session()
+    retry = Retry(total=1, allowed_methods=frozenset(["GET"]))
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+    return session
+
+
+def ping_api(endpoint: str, token: str, verify_ssl: bool = False) -> bool:
+    """Ping the CyberArk API to keep the token alive."""
     url = f"https://{endpoint}/PasswordVault/API/Safes"
     headers = {
         "Authorization": token,
@@ -45,7 +77,7 @@ def ping_api(endpoint: str, token: str, verify_ssl: bool = False) -> bool:
     }
     
     try:
-        response = requests.get(
+        response = _get_session(verify_ssl).get(
             url,
             headers=headers,
             params={"limit": 1},
@@ -77,67 +109,73 @@ def run_keepalive(
     log_path = project_dir / "keepalive.log"
     pid_path = project_dir / "keepalive.pid"
     
-    # Write our PID
-    pid_path.write_text(str(os.getpid()))
+    # Write our PID via a temp file so the parent never sees it half-written
+    tmp_pid_path = pid_path.with_name("keepalive.pid.tmp")
+    pid_fd = os.open(str(tmp_pid_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.write(pid_fd, str(os.getpid()).encode())
+    os.close(pid_fd)
+    os.replace(tmp_pid_path, pid_path)
     
-    # Initialize log
-    with open(log_path, "w") as f:
-        f.write(f"[{datetime.now()}] Keepalive started for endpoint: {endpoint}\n")
-        f.write(f"[{datetime.now()}] Hard timeout: {timeout_seconds}s ({timeout_seconds/3600:.1f} hours)\n")
-        f.write(f"[{datetime.now()}] PID: {os.getpid()}\n")
+    # Initialize log; the fd stays open for the life of the process and
+    # unbuffered os.write() puts each message on disk immediately
+    log_fd = os.open(str(log_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    atexit.register(os.close, log_fd)
+    log(f"Keepalive started for endpoint: {endpoint}", log_fd)
+    log(f"Hard timeout: {timeout_seconds}s ({timeout_seconds/3600:.1f} hours)", log_fd)
+    log(f"PID: {os.getpid()}", log_fd)
     
-    start_time = time.time()
+    # Monotonic, so wall-clock jumps can't end the keepalive early or late
+    deadline = time.monotonic() + timeout_seconds
     
     # Handle graceful shutdown
-    def shutdown(signum, frame):
-        log(f"Received signal {signum}, shutting down", log_path)
-        cleanup_and_exit(0)
-    
-    def cleanup_and_exit(code: int):
-        if pid_path.exists():
-            pid_path.unlink()
-        sys.exit(code)
-    
+    shutdown = functools.partial(_shutdown, log_fd, pid_path)
     signal.signal(signal.SIGTERM, shutdown)
     signal.signal(signal.SIGINT, shutdown)
     
+    token = ""
+    token_mtime = None
+    
     while True:
-        elapsed = time.time() - start_time
-        remaining = timeout_seconds - elapsed
+        remaining = deadline - time.monotonic()
         
         # Check hard timeout
         if remaining <= 0:
-            log(f"Hard timeout reached ({timeout_seconds}s), exiting", log_path)
-            cleanup_and_exit(0)
+            log(f"Hard timeout reached ({timeout_seconds}s), exiting", log_fd)
+            _cleanup_and_exit(pid_path, 0)
         
-        # Random sleep between min and max interval
+        # Random sleep between min and max interval, never past the deadline
         sleep_time = min(random.randint(min_interval, max_interval), remaining)
         
-        log(f"Sleeping {sleep_time}s (remaining: {remaining/3600:.1f}h)", log_path)
+        log(f"Sleeping {sleep_time}s (remaining: {remaining/3600:.1f}h)", log_fd)
         time.sleep(sleep_time)
         
-        # Check timeout again after sleep
-        elapsed = time.time() - start_time
-        if elapsed >= timeout_seconds:
-            log(f"Hard timeout reached after sleep, exiting", log_path)
-            cleanup_and_exit(0)
+        # A sleep cut short by the deadline means the hard timeout is reached
+        if sleep_time >= remaining:
+            log(f"Hard timeout reached after sleep, exiting", log_fd)
+            _cleanup_and_exit(pid_path, 0)
+        elapsed = timeout_seconds - remaining + sleep_time
         
-        # Read fresh token from file
-        if not token_path.exists():
-            log("Token file missing, exiting", log_path)
-            cleanup_and_exit(1)
+        # Re-read the token only if the file changed (the app rewrites it
+        # on re-authentication); one stat per ping otherwise
+        try:
+            mtime = token_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            log("Token file missing, exiting", log_fd)
+            _cleanup_and_exit(pid_path, 1)
         
-        token = token_path.read_text().strip()
+        if mtime != token_mtime:
+            token = token_path.read_text().strip()
+            token_mtime = mtime
         if not token:
-            log("Token is empty, exiting", log_path)
-            cleanup_and_exit(1)
+            log("Token is empty, exiting", log_fd)
+            _cleanup_and_exit(pid_path, 1)
         
         # Ping the API
         if ping_api(endpoint, token):
-            log(f"Keepalive ping successful (elapsed: {elapsed/3600:.1f}h)", log_path)
+            log(f"Keepalive ping successful (elapsed: {elapsed/3600:.1f}h)", log_fd)
         else:
-            log("Keepalive ping failed - token expired or invalid, exiting", log_path)
-            cleanup_and_exit(1)
+            log("Keepalive ping failed - token expired or invalid, exiting", log_fd)
+            _cleanup_and_exit(pid_path, 1)
 
 
 def main():
@@ -1,17 +1,46 @@
 """SSH and SCP connection handling."""
 
 import os
+import functools
 import subprocess
 import shutil
-from typing import Optional
 from pathlib import Path
 
-from rich.console import Console
-
 from .config import Config
 from .accounts import Account
+from .console import get_console
+
+
+@functools.lru_cache(maxsize=4)
+def _find_exe(name: str) -> str:
+    """Find an OpenSSH executable (searched once per interpreter)."""
+    if os.name == "nt":
+        # Windows - check common locations
+        candidates = [
+            shutil.which(name),
+            rf"C:\Windows\System32\OpenSSH\{name}.exe",
+            rf"C:\Program Files\Git\usr\bin\{name}.exe",
+        ]
+        for candidate in candidates:
+            if candidate and Path(candidate).exists():
+                return candidate
+        return name
+    
+    return shutil.which(name) or name
 
-console = Console()
+
+def _run(cmd: list[str]) -> int:
+    """
+    Run an interactive command and return its exit code.
+    
+    On Unix, close_fds=False with an absolute executable path lets CPython
+    use posix_spawn() instead of fork+exec, so the parent's page tables are
+    never copied. Python's own fds are non-inheritable (PEP 446), so
+    nothing extra leaks into ssh/scp.
+    """
+    if os.name == "nt":
+        return subprocess.run(cmd).returncode
+    return subprocess.run(cmd, close_fds=False).returncode
 
 
 class SSHManager:
@@ -19,52 +48,23 @@ class SSHManager:
     
     def __init__(self, config: Config):
         self.config = config
-        self._ssh_path: Optional[str] = None
-        self._scp_path: Optional[str] = None
+        self._ssh_path = _find_exe("ssh")
+        self._scp_path = _find_exe("scp")
+        # Checked once: the key is downloaded before SSHManager is created
+        self._key_args = (
+            ["-i", self.config.ssh_key_path]
+            if Path(self.config.ssh_key_path).exists() else []
+        )
     
     @property
     def ssh_path(self) -> str:
         """Get path to SSH executable."""
-        if self._ssh_path:
-            return self._ssh_path
-        
-        # Try to find ssh
-        if os.name == "nt":
-            # Windows - check common locations
-            candidates = [
-                shutil.which("ssh"),
-                r"C:\Windows\System32\OpenSSH\ssh.exe",
-                r"C:\Program Files\Git\usr\bin\ssh.exe",
-            ]
-            for candidate in candidates:
-                if candidate and Path(candidate).exists():
-                    self._ssh_path = candidate
-                    return self._ssh_path
-        else:
-            self._ssh_path = shutil.which("ssh") or "ssh"
-        
-        return self._ssh_path or "ssh"
+        return self._ssh_path
     
     @property
     def scp_path(self) -> str:
         """Get path to SCP executable."""
-        if self._scp_path:
-            return self._scp_path
-        
-        if os.name == "nt":
-            candidates = [
-                shutil.which("scp"),
-                r"C:\Windows\System32\OpenSSH\scp.exe",
-                r"C:\Program Files\Git\usr\bin\scp.exe",
-            ]
-            for candidate in candidates:
-                if candidate and Path(candidate).exists():
-                    self._scp_path = candidate
-                    return self._scp_path
-        else:
-            self._scp_path = shutil.which("scp") or "scp"
-        
-        return self._scp_path or "scp"
+        return self._scp_path
     
     def build_connection_string(self, account: Account) -> str:
         """
@@ -74,27 +74,28 @@ class SSHManager:
         """
         return f"{self.config.username}@{account.username}@{account.address}@{self.config.endpoint}"
     
-    def connect(self, account: Account, use_key: bool = True) -> int:
+    def connect(self, account: Account, use_key: bool = True, exec_mode: bool = False) -> int:
         """
         SSH to an account via CyberArk PSM.
         
+        With exec_mode (Unix only), the Python process is replaced by ssh
+        and this never returns.
+        
         Returns the exit code of the SSH process.
         """
         connection_string = self.build_connection_string(account)
         
-        cmd = [self.ssh_path]
-        
-        # Add SSH key if available
-        if use_key and Path(self.config.ssh_key_path).exists():
-            cmd.extend(["-i", self.config.ssh_key_path])
+        key_args = self._key_args if use_key else []
+        cmd = [self.ssh_path, *key_args, connection_string]
         
-        cmd.append(connection_string)
+        get_console().print(f"[cyan]Connecting to {account.username}@{account.address}...[/cyan]")
         
-        console.print(f"[cyan]Connecting to {account.username}@{account.address}...[/cyan]")
+        if exec_mode and os.name != "nt":
+            # Hand the terminal to ssh and free this interpreter's memory
+            os.execvp(self.ssh_path, cmd)
         
         # Run interactively
-        result = subprocess.run(cmd)
-        return result.returncode
+        return _run(cmd)
     
     def scp_send(
         self,
@@ -110,23 +111,20 @@ class SSHManager:
         """
         connection_string = self.build_connection_string(account)
         
-        cmd = [self.scp_path, "-O"]  # -O for legacy protocol compatibility
+        key_args = self._key_args if use_key else []
+        # -O for legacy protocol compatibility
+        cmd = [self.scp_path, "-O", *key_args, local_path, f"{connection_string}:{remote_path}"]
         
-        if use_key and Path(self.config.ssh_key_path).exists():
-            cmd.extend(["-i", self.config.ssh_key_path])
+        get_console().print(f"[cyan]Sending {local_path} to {account.address}:{remote_path}...[/cyan]")
         
-        cmd.extend([local_path, f"{connection_string}:{remote_path}"])
+        returncode = _run(cmd)
         
-        console.print(f"[cyan]Sending {local_path} to {account.address}:{remote_path}...[/cyan]")
-        
-        result = subprocess.run(cmd)
-        
-        if result.returncode == 0:
-            console.print("[green]Transfer complete[/green]")
+        if returncode == 0:
+            get_console().print("[green]Transfer complete[/green]")
         else:
-            console.print(f"[red]Transfer failed (exit code: {result.returncode})[/red]")
+            get_console().print(f"[red]Transfer failed (exit code: {returncode})[/red]")
         
-        return result.returncode
+        return returncode
     
     def scp_receive(
         self,
@@ -142,21 +140,17 @@ class SSHManager:
         """
         connection_string = self.build_connection_string(account)
         
-        cmd = [self.scp_path, "-O"]
-        
-        if use_key and Path(self.config.ssh_key_path).exists():
-            cmd.extend(["-i", self.config.ssh_key_path])
-        
-        cmd.extend([f"{connection_string}:{remote_path}", local_path])
+        key_args = self._key_args if use_key else []
+        cmd = [self.scp_path, "-O", *key_args, f"{connection_string}:{remote_path}", local_path]
         
-        console.print(f"[cyan]Receiving {remote_path} from {account.address}...[/cyan]")
+        get_console().print(f"[cyan]Receiving {remote_path} from {account.address}...[/cyan]")
         
-        result = subprocess.run(cmd)
+        returncode = _run(cmd)
         
-        if result.returncode == 0:
-            console.print(f"[green]Transfer complete: {local_path}[/green]")
+        if returncode == 0:
+            get_console().print(f"[green]Transfer complete: {local_path}[/green]")
         else:
-            console.print(f"[red]Transfer failed (exit code: {result.returncode})[/red]")
+            get_console().print(f"[red]Transfer failed (exit code: {returncode})[/red]")
         
-        return result.returncode
+        return returncode
 
@@ -5,11 +5,14 @@ from enum import Enum
 
 import questionary
 from questionary import Style
-from rich.console import Console
 
-from .accounts import Account
+try:
+    from iterfzf import iterfzf  # Optional: fzf matcher for large account lists
+except ImportError:
+    iterfzf = None
 
-console = Console()
+from .accounts import Account
+from .console import get_console
 
 T = TypeVar("T")
 
@@ -39,32 +42,64 @@ class AccountAction(Enum):
     BACK = "← Back to search"
 
 
-MAX_DISPLAY_ACCOUNTS = 36  # Limited by questionary shortcuts (0-9, a-z)
+MAX_DISPLAY_ACCOUNTS = 36  # Limited by questionary shortcuts (0-9, a-z); not applied with fzf
+
+# Action menu, built once; grouped visually. questionary assigns shortcut_key/
+# auto_shortcut on these Choice objects each time the prompt is built, but by
+# list position, so every rebuild writes the same values and reuse is safe.
+_ACTION_CHOICES = [
+    questionary.Choice(title="SSH", value=AccountAction.SSH),
+    questionary.Separator("── Information ──"),
+    questionary.Choice(title="Get Password", value=AccountAction.GET_PASSWORD),
+    questionary.Choice(title="Info", value=AccountAction.INFO),
+    questionary.Choice(title="Verify", value=AccountAction.VERIFY),
+    questionary.Separator("── SCP ──"),
+    questionary.Choice(title="SCP Send", value=AccountAction.SCP_SEND),
+    questionary.Choice(title="SCP Receive", value=AccountAction.SCP_RECEIVE),
+    questionary.Separator("── Modify ──"),
+    questionary.Choice(title="Change", value=AccountAction.CHANGE),
+    questionary.Choice(title="Delete", value=AccountAction.DELETE),
+    questionary.Separator("──────────"),
+    questionary.Choice(title="← Back to search", value=AccountAction.BACK),
+]
 
 
 def select_account(accounts: list[Account]) -> Optional[Account]:
     """
     Interactive fuzzy selection of an account.
     
+    Uses fzf (via iterfzf) when installed, which matches in native code
+    and has no list length limit; otherwise a questionary menu.
+    
     Returns the selected Account or None if cancelled.
     """
     if not accounts:
-        console.print("[yellow]No accounts to select from[/yellow]")
+        get_console().print("[yellow]No accounts to select from[/yellow]")
         return None
     
+    if iterfzf is not None:
+        by_label = {acc.display_name: acc for acc in accounts}
+        try:
+            label = iterfzf(by_label, prompt="Select an account: ")
+        except KeyboardInterrupt:
+            # fzf exits 130 on both Esc and Ctrl-C; treat as cancel, like questionary
+            return None
+        return by_label.get(label) if label else None
+    
     if len(accounts) > MAX_DISPLAY_ACCOUNTS:
-        console.print(
+        get_console().print(
             f"[yellow]Too many results ({len(accounts)} accounts). "
             f"Please refine your search (max {MAX_DISPLAY_ACCOUNTS}).[/yellow]"
         )
         return None
     
+    # Choices carry only an index into accounts, not the Account itself
     choices = [
         questionary.Choice(
             title=acc.display_name,
-            value=acc,
+            value=i,
         )
-        for acc in accounts
+        for i, acc in enumerate(accounts)
     ]
     
     result = questionary.select(
@@ -74,7 +109,7 @@ def select_account(accounts: list[Account]) -> Optional[Account]:
         use_shortcuts=True,
     ).ask()
     
-    return result
+    return accounts[result] if result is not None else None
 
 
 def select_action() -> Optional[AccountAction]:
@@ -83,26 +118,9 @@ def select_action() -> Optional[AccountAction]:
     
     Returns the selected action or None if cancelled.
     """
-    # Group actions visually
-    choices = [
-        questionary.Choice(title="SSH", value=AccountAction.SSH),
-        questionary.Separator("── Information ──"),
-        questionary.Choice(title="Get Password", value=AccountAction.GET_PASSWORD),
-        questionary.Choice(title="Info", value=AccountAction.INFO),
-        questionary.Choice(title="Verify", value=AccountAction.VERIFY),
-        questionary.Separator("── SCP ──"),
-        questionary.Choice(title="SCP Send", value=AccountAction.SCP_SEND),
-        questionary.Choice(title="SCP Receive", value=AccountAction.SCP_RECEIVE),
-        questionary.Separator("── Modify ──"),
-        questionary.Choice(title="Change", value=AccountAction.CHANGE),
-        questionary.Choice(title="Delete", value=AccountAction.DELETE),
-        questionary.Separator("──────────"),
-        questionary.Choice(title="← Back to search", value=AccountAction.BACK),
-    ]
-    
     result = questionary.select(
         "Select an action:",
-        choices=choices,
+        choices=_ACTION_CHOICES,
         style=STYLE,
     ).ask()
     
@@ -134,6 +152,15 @@ def prompt_path(message: str, default: str = "") -> Optional[str]:
     ).ask()
 
 
+def press_any_key(message: str = "Press any key to continue...") -> None:
+    """
+    Wait for a single key press (no Enter needed).
+    
+    Ctrl+C raises KeyboardInterrupt, as input() did.
+    """
+    questionary.press_any_key_to_continue(message, style=STYLE).unsafe_ask()
+
+
 def confirm(message: str, default: bool = False) -> bool:
     """Confirm a yes/no question."""
     result = questionary.confirm(
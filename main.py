@@ -11,27 +11,20 @@ Examples:
     python main.py --endpoint cyberark-dr  # Use alternate endpoint
 """
 
+from __future__ import annotations
+
 import sys
 import argparse
-import json
-
-from rich.console import Console
+from typing import TYPE_CHECKING
 
-from cyberark_fuzzy.config import get_config
-from cyberark_fuzzy.api import CyberArkAPI
-from cyberark_fuzzy.auth import AuthManager
-from cyberark_fuzzy.accounts import AccountManager, Account
-from cyberark_fuzzy.ssh import SSHManager
-from cyberark_fuzzy.ui import (
-    select_account,
-    select_action,
-    prompt_search,
-    prompt_path,
-    confirm,
-    AccountAction,
-)
+# The rest of the package (requests, rich, questionary) is imported after
+# argument parsing, so --help and bad arguments return immediately
+from cyberark_fuzzy.console import get_console
 
-console = Console()
+if TYPE_CHECKING:
+    from cyberark_fuzzy.accounts import AccountManager, Account
+    from cyberark_fuzzy.ssh import SSHManager
+    from cyberark_fuzzy.ui import AccountAction
 
 
 def parse_args() -> argparse.Namespace:
@@ -61,6 +54,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Save password to credential store",
     )
+    parser.add_argument(
+        "--exec-ssh",
+        action="store_true",
+        help="Replace this process with ssh on SSH (exits the menu; Unix only)",
+    )
     return parser.parse_args()
 
 
@@ -69,25 +67,28 @@ def handle_action(
     account: Account,
     account_mgr: AccountManager,
     ssh_mgr: SSHManager,
+    exec_ssh: bool = False,
 ) -> bool:
     """
     Handle the selected action.
     
     Returns True if should continue with action menu, False to go back to search.
     """
+    from cyberark_fuzzy.ui import AccountAction, prompt_path, confirm
+    
     match action:
         case AccountAction.SSH:
-            ssh_mgr.connect(account)
+            ssh_mgr.connect(account, exec_mode=exec_ssh)
         
         case AccountAction.GET_PASSWORD:
             password = account_mgr.get_password(account)
             if password:
-                console.print(f"[green]Password:[/green] {password}")
+                get_console().print(f"[green]Password:[/green] {password}")
         
         case AccountAction.INFO:
             info = account_mgr.get_info(account)
             if info:
-                console.print_json(json.dumps(info, indent=2))
+                get_console().print_json(data=info)
         
         case AccountAction.VERIFY:
             account_mgr.verify(account)
@@ -123,6 +124,12 @@ def main() -> int:
     """Main entry point."""
     args = parse_args()
     
+    from cyberark_fuzzy.config import get_config
+    from cyberark_fuzzy.api import CyberArkAPI
+    from cyberark_fuzzy.auth import AuthManager
+    from cyberark_fuzzy.accounts import AccountManager
+    from cyberark_fuzzy.ui import select_account, select_action, prompt_search, press_any_key
+    
     # Initialize components
     config = get_config(endpoint=args.endpoint, username=args.username)
     config.ensure_config_dir()
@@ -130,13 +137,11 @@ def main() -> int:
     api = CyberArkAPI(config)
     auth_mgr = AuthManager(config, api)
     account_mgr = AccountManager(api)
-    ssh_mgr = SSHManager(config)
     
     # Authenticate
-    if not auth_mgr.check_and_refresh():
-        if not auth_mgr.authenticate(save_password=args.save_password):
-            console.print("[red]Authentication failed. Exiting.[/red]")
-            return 1
+    if not auth_mgr.check_and_refresh(save_password=args.save_password):
+        get_console().print("[red]Authentication failed. Exiting.[/red]")
+        return 1
     
     # Start keepalive
     auth_mgr.start_keepalive()
@@ -145,7 +150,11 @@ def main() -> int:
     if config.endpoint == "cyberark":
         auth_mgr.download_ssh_key()
     else:
-        console.print("[yellow]Alternate endpoint - skipping SSH key download[/yellow]")
+        get_console().print("[yellow]Alternate endpoint - skipping SSH key download[/yellow]")
+    
+    # Created after the key download so it sees the key file
+    from cyberark_fuzzy.ssh import SSHManager
+    ssh_mgr = SSHManager(config)
     
     try:
         # Main loop
@@ -160,15 +169,15 @@ def main() -> int:
             
             # Check auth is still valid
             if not auth_mgr.check_and_refresh():
-                console.print("[red]Authentication lost. Exiting.[/red]")
+                get_console().print("[red]Authentication lost. Exiting.[/red]")
                 return 1
             
             # Search for accounts
-            console.print(f"[cyan]Searching for: {search_term}[/cyan]")
+            get_console().print(f"[cyan]Searching for: {search_term}[/cyan]")
             accounts = account_mgr.search(search_term)
             
             if not accounts:
-                console.print("[yellow]No accounts found[/yellow]")
+                get_console().print("[yellow]No accounts found[/yellow]")
                 search_term = None
                 continue
             
@@ -184,21 +193,21 @@ def main() -> int:
                 if not action:
                     break
                 
-                if not handle_action(action, account, account_mgr, ssh_mgr):
+                if not handle_action(action, account, account_mgr, ssh_mgr, args.exec_ssh):
                     break
                 
                 # Check auth after action
                 if not auth_mgr.check_and_refresh():
-                    console.print("[red]Authentication lost.[/red]")
+                    get_console().print("[red]Authentication lost.[/red]")
                     break
                 
-                input("\nPress Enter to continue...")
+                press_any_key("\nPress any key to continue...")
             
             # Reset search for next iteration
             search_term = None
     
     except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted[/yellow]")
+        get_console().print("\n[yellow]Interrupted[/yellow]")
     
     # Note: We intentionally don't stop the keepalive here.
     # It runs as a detached process with a ~9 hour hard timeout,